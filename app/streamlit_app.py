@@ -5,10 +5,12 @@ Google Flights inspired UI for flight route analysis
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import folium
-from folium.plugins import MarkerCluster
+from folium.plugins import FastMarkerCluster
+import streamlit.components.v1 as components
 from streamlit_folium import st_folium
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Optional
 import sys
 from pathlib import Path
 
@@ -25,8 +27,8 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Custom CSS - Google Flights style
-st.markdown("""
+# Custom CSS - Google Flights style (emitted together with the page header in main)
+_PAGE_STYLE = """
 <style>
     .main-header {
         font-size: 2rem;
@@ -80,6 +82,23 @@ st.markdown("""
         font-size: 0.85rem;
         font-weight: 500;
     }
+    .hero-metrics {
+        display: flex;
+        gap: 1rem;
+    }
+    .metric-chip {
+        flex: 1;
+        display: flex;
+        flex-direction: column;
+    }
+    .metric-chip small {
+        color: #5f6368;
+        font-size: 0.85rem;
+    }
+    .metric-chip span {
+        color: #202124;
+        font-size: 1.75rem;
+    }
     .stButton>button {
         background-color: #1a73e8;
         color: white;
@@ -92,18 +111,48 @@ st.markdown("""
         background-color: #1557b0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
 
-@st.cache_data
+@st.cache_resource
 def load_data():
-    """Load flight data with caching"""
+    """Load flight data with caching (shared analyzer, persisted to disk across restarts)"""
+    import pickle
+    import pipeline.graph_analyzer as graph_analyzer_module
+    
+    data_dir = Path("data/cleaned")
+    analyzer_file = data_dir / "analyzer.pkl"
+    # Rebuild when the cleaned data or the analyzer code is newer than the pickle
+    sources = [
+        data_dir / "airports_cleaned.csv",
+        data_dir / "routes_graph.csv",
+        Path(graph_analyzer_module.__file__),
+    ]
+    
+    if analyzer_file.exists():
+        try:
+            cache_mtime = analyzer_file.stat().st_mtime
+            if all(src.stat().st_mtime < cache_mtime for src in sources if src.exists()):
+                # Load the prebuilt graph + lookups instead of parsing CSVs again
+                with analyzer_file.open('rb') as f:
+                    return pickle.load(f)
+        except Exception:
+            # If the pickle is stale or corrupted, delete it and rebuild
+            analyzer_file.unlink(missing_ok=True)
+    
     try:
         analyzer = create_flight_analyzer("data/cleaned")
-        return analyzer
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
         return None
+    
+    try:
+        with analyzer_file.open('wb') as f:
+            pickle.dump(analyzer, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        # Persisting is only an optimization; never fail the app over it
+        analyzer_file.unlink(missing_ok=True)
+    return analyzer
 
 
 @st.cache_data(show_spinner="Loading hub data...")
@@ -147,16 +196,54 @@ def load_all_hubs_data(_analyzer: FlightGraphAnalyzer):
         return []
 
 
+@st.cache_data(show_spinner=False)
+def load_airport_labels(_analyzer: FlightGraphAnalyzer) -> Dict[str, str]:
+    """Build the IATA -> label map once; the selectbox searches these labels
+
+    Note: _analyzer has leading underscore so Streamlit doesn't try to hash it
+    """
+    return get_airport_display_map(_analyzer.airports_df)
+
+
+@st.cache_data(show_spinner=False)
+def load_airport_options(_analyzer: FlightGraphAnalyzer) -> List[str]:
+    """Sorted IATA codes for the From/To selectboxes, computed once
+
+    Note: _analyzer has leading underscore so Streamlit doesn't try to hash it
+    """
+    airports_df = _analyzer.airports_df
+    return airports_df.loc[airports_df['iata'].notna(), 'iata'].sort_values().tolist()
+
+
+@st.cache_data(show_spinner=False)
+def load_country_options(_analyzer: FlightGraphAnalyzer) -> List[str]:
+    """Country filter options for the hubs map, computed once
+
+    Note: _analyzer has leading underscore so Streamlit doesn't try to hash it
+    """
+    all_hubs = load_all_hubs_data(_analyzer=_analyzer)
+    countries = sorted(set(h.get('country', '') for h in all_hubs if h.get('country')))
+    return ["All Countries"] + countries
+
+
+@st.cache_data(show_spinner=False)
+def load_network_stats(_analyzer: FlightGraphAnalyzer) -> Dict[str, Any]:
+    """Compute network statistics once; the graph never changes after loading
+
+    Note: _analyzer has leading underscore so Streamlit doesn't try to hash it
+    """
+    return _analyzer.get_network_stats()
+
+
 @st.cache_data
-def get_filtered_hubs(hubs_data: List[Dict[str, Any]], country: str, size_metric: str, _cache_key: int = 0) -> List[Dict[str, Any]]:
-    """Filter and sort hubs; cached by country + size metric + cache_key
+def get_filtered_hubs(_hubs_data: List[Dict[str, Any]], country: str, size_metric: str) -> List[Dict[str, Any]]:
+    """Filter and sort hubs; cached by country + size metric
     
-    Args:
-        _cache_key: Internal cache invalidation key (leading underscore prevents Streamlit from showing it)
+    Note: _hubs_data has leading underscore so Streamlit doesn't hash the (static) hub list
     """
-    filtered = hubs_data
+    filtered = _hubs_data
     if country and country != "All Countries":
-        filtered = [h for h in hubs_data if h.get('country', '') == country]
+        filtered = [h for h in _hubs_data if h.get('country', '') == country]
     # Sort by degree centrality (primary) and betweenness (secondary) for stability
     filtered = sorted(
         filtered,
@@ -168,15 +255,12 @@ def get_filtered_hubs(hubs_data: List[Dict[str, Any]], country: str, size_metric
 
 def get_airport_display_map(airports_df: pd.DataFrame) -> Dict[str, str]:
     """Return mapping from IATA to descriptive label"""
-    display_map = {}
-    for _, airport in airports_df.iterrows():
-        if pd.notna(airport.get('iata')):
-            iata = str(airport.get('iata', ''))
-            name = str(airport.get('name', ''))
-            city = str(airport.get('city', ''))
-            country = str(airport.get('country', ''))
-            display_map[iata] = f"{iata} - {name} ({city}, {country})"
-    return display_map
+    airports = airports_df[airports_df['iata'].notna()]
+    # Concatenate whole columns at once instead of formatting row by row
+    iata = airports['iata'].astype(str)
+    name, city, country = (airports[col].fillna('').astype(str) for col in ('name', 'city', 'country'))
+    labels = iata + " - " + name + " (" + city + ", " + country + ")"
+    return dict(zip(iata, labels))
 
 
 def get_popular_routes():
@@ -197,8 +281,7 @@ def create_route_map(coordinates: List[Tuple[float, float, str]],
     if not coordinates:
         return None
 
-    center_lat = sum(coord[0] for coord in coordinates) / len(coordinates)
-    center_lon = sum(coord[1] for coord in coordinates) / len(coordinates)
+    center_lat, center_lon = np.array([coord[:2] for coord in coordinates], dtype=float).mean(axis=0)
     
     m = folium.Map(location=[center_lat, center_lon], zoom_start=4)
     
@@ -243,11 +326,11 @@ def create_interactive_map(
         # Calculate center and zoom (prefers route when available)
         center_lat, center_lon, zoom_start = _calculate_map_center(hub_coords, route_coords)
         
-        # Create map with error handling
+        # Create map with error handling; draw vector layers on one canvas, not per-marker SVG nodes
         try:
-            m = folium.Map(location=[center_lat, center_lon], zoom_start=zoom_start)
+            m = folium.Map(location=[center_lat, center_lon], zoom_start=zoom_start, prefer_canvas=True)
         except Exception:
-            m = folium.Map(location=[20, 0], zoom_start=2)
+            m = folium.Map(location=[20, 0], zoom_start=2, prefer_canvas=True)
         
         # Add route line if available
         _add_route_line(m, route_coords, route_path)
@@ -261,6 +344,13 @@ def create_interactive_map(
         return None
 
 
+def _valid_route_coords(route_coords: List[Tuple[float, float]]) -> np.ndarray:
+    """Return the (lat, lon) pairs within valid bounds as an (n, 2) array"""
+    coords = np.asarray(route_coords, dtype=float).reshape(-1, 2)
+    lats, lons = coords[:, 0], coords[:, 1]
+    return coords[(lats >= -90) & (lats <= 90) & (lons >= -180) & (lons <= 180)]
+
+
 def _add_route_line(
     map_obj: folium.Map,
     route_coords: List[Tuple[float, float]] = None,
@@ -271,9 +361,7 @@ def _add_route_line(
         return
     
     try:
-        valid_route_coords = [(lat, lon) for lat, lon in route_coords 
-                             if isinstance(lat, (int, float)) and isinstance(lon, (int, float))
-                             and -90 <= lat <= 90 and -180 <= lon <= 180]
+        valid_route_coords = _valid_route_coords(route_coords).tolist()
         if len(valid_route_coords) > 1:
             folium.PolyLine(
                 valid_route_coords,
@@ -312,9 +400,36 @@ def _add_route_line(
         pass
 
 
+@st.cache_resource(show_spinner=False, max_entries=32)
+def build_hubs_map(
+    _analyzer: FlightGraphAnalyzer,
+    _filtered_hubs: List[Dict[str, Any]],
+    country: str,
+    size_metric: str,
+    from_airport: str,
+    to_airport: str
+) -> folium.Map:
+    """Build the hubs map once per filter + selection combination
+    
+    Note: _analyzer and _filtered_hubs have leading underscores so Streamlit doesn't
+    hash them; the filtered hubs are fully determined by country + size_metric
+    """
+    # Always show hubs; no route overlay here
+    return create_interactive_map(
+        hubs_data=_filtered_hubs,
+        analyzer=_analyzer,
+        size_metric=size_metric,
+        selected_from=from_airport,
+        selected_to=to_airport,
+        route_path=None,
+        route_coords=None
+    )
+
+
 def _render_main_map(
     analyzer: FlightGraphAnalyzer,
     filtered_hubs: List[Dict[str, Any]],
+    country: str,
     size_metric: str,
     from_airport: str,
     to_airport: str
@@ -322,32 +437,55 @@ def _render_main_map(
     """Render the hubs map (no route overlay)"""
     st.markdown("### 🌍 Hubs Map")
     
-    # Always show hubs; no route overlay here
     try:
-        interactive_map = create_interactive_map(
-            hubs_data=filtered_hubs,
-            analyzer=analyzer,
-            size_metric=size_metric,
-            selected_from=from_airport,
-            selected_to=to_airport,
-            route_path=None,
-            route_coords=None
+        interactive_map = build_hubs_map(
+            analyzer, filtered_hubs, country, size_metric, from_airport, to_airport
         )
         
         if interactive_map is not None:
             map_key = f"hubs_map_{len(filtered_hubs)}_{size_metric}"
-            st_folium(interactive_map, width=1200, height=650, key=map_key)
+            st_folium(interactive_map, width=1200, height=650, key=map_key, returned_objects=[])
         else:
             st.error("Failed to create hubs map.")
     except Exception as e:
         st.error(f"Error creating hubs map: {str(e)}")
         try:
             fallback_map = folium.Map(location=[20, 0], zoom_start=2)
-            st_folium(fallback_map, width=1200, height=650, key="hubs_fallback_map")
+            st_folium(fallback_map, width=1200, height=650, key="hubs_fallback_map", returned_objects=[])
         except:
             pass
 
 
+@st.cache_data(show_spinner=False, max_entries=64)
+def load_route_map_html(_analyzer: FlightGraphAnalyzer, route_path: Tuple[str, ...]) -> Optional[str]:
+    """Render a route-only map to static HTML once per path
+    
+    Note: _analyzer has leading underscore so Streamlit doesn't try to hash it
+    """
+    path_coordinates = _analyzer.get_airport_coordinates(list(route_path))
+    if not path_coordinates:
+        return None
+    route_coords = [(lat, lon) for lat, lon, _ in path_coordinates]
+    route_map = create_interactive_map(
+        hubs_data=[],  # no hubs to avoid clutter
+        analyzer=_analyzer,
+        size_metric="degree_centrality",
+        selected_from=route_path[0] if route_path else None,
+        selected_to=route_path[-1] if route_path else None,
+        route_path=list(route_path),
+        route_coords=route_coords
+    )
+    return route_map.get_root().render() if route_map else None
+
+
+def _embed_map_html(html: str, height: int) -> None:
+    """Embed static map HTML (st.iframe where available, components.html on older Streamlit)"""
+    if hasattr(st, "iframe"):
+        st.iframe(html, height=height)
+    else:
+        components.html(html, height=height)
+
+
 def _render_route_map(analyzer: FlightGraphAnalyzer) -> None:
     """Render a separate map for the main route (if any)"""
     if 'route_result' not in st.session_state:
@@ -356,28 +494,39 @@ def _render_route_map(analyzer: FlightGraphAnalyzer) -> None:
     if "error" in result:
         return
     route_path = result.get('path', [])
-    path_coordinates = analyzer.get_airport_coordinates(route_path)
-    if not path_coordinates:
-        return
-    route_coords = [(lat, lon) for lat, lon, _ in path_coordinates]
-        
-    st.markdown("### ✈️ Route Map")
+
     try:
-        route_map = create_interactive_map(
-            hubs_data=[],  # no hubs to avoid clutter
-            analyzer=analyzer,
-            size_metric="degree_centrality",
-            selected_from=route_path[0] if route_path else None,
-            selected_to=route_path[-1] if route_path else None,
-            route_path=route_path,
-            route_coords=route_coords
-        )
-        if route_map:
-            st_folium(route_map, width=1200, height=650, key="route_only_map")
+        # Display-only map: embed the cached HTML instead of the st_folium bridge
+        route_map_html = load_route_map_html(_analyzer=analyzer, route_path=tuple(route_path))
+        if not route_map_html:
+            return
+        st.markdown("### ✈️ Route Map")
+        _embed_map_html(route_map_html, height=650)
     except Exception as e:
         st.error(f"Error rendering route map: {str(e)}")
 
 
+# Leaflet callback for FastMarkerCluster rows:
+# [lat, lon, radius, color, iata, name, city, country, degree, betweenness]
+_HUB_MARKER_CALLBACK = """
+function (row) {
+    var marker = L.circleMarker(new L.LatLng(row[0], row[1]), {
+        radius: row[2], color: row[3], fill: true, fillColor: row[3],
+        fillOpacity: 0.7, weight: 3
+    });
+    marker.bindTooltip(row[4] + ' - ' + row[5]);
+    marker.bindPopup(function () {
+        return '<div style="min-width: 200px;"><b>' + row[4] + '</b><br>' +
+            row[5] + '<br>' + row[6] + ', ' + row[7] + '<br><hr>' +
+            '<b>Centrality:</b><br>Degree: ' + row[8].toFixed(4) + '<br>' +
+            'Betweenness: ' + row[9].toFixed(4) + '<br><hr>' +
+            '<small>Click to select as From/To</small></div>';
+    }, {maxWidth: 250});
+    return marker;
+}
+"""
+
+
 def _add_hub_markers(
     map_obj: folium.Map,
     hub_coords: List[Dict[str, Any]],
@@ -400,56 +549,31 @@ def _add_hub_markers(
         max_val = max(values)
         range_val = max_val - min_val if max_val > min_val else 1
 
-        # Cluster markers to improve map performance with many hubs
-        cluster = MarkerCluster()
-        cluster.add_to(map_obj)
+        # Build one compact row per hub; the browser creates the markers and
+        # popups (see _HUB_MARKER_CALLBACK) instead of one Python object each
+        rows = []
+        for hub, centrality in zip(hub_coords, values):
+            # Calculate radius based on centrality
+            radius = max(5, min(30, 5 + (centrality - min_val) / range_val * 25)) if range_val > 0 else 15
+            
+            # Determine color based on selection
+            if hub['iata'] == selected_from:
+                color = '#34a853'  # Green for source
+            elif hub['iata'] == selected_to:
+                color = '#ea4335'  # Red for destination
+            elif route_path and hub['iata'] in route_path:
+                color = '#1a73e8'  # Blue for route stops
+            else:
+                color = '#5f6368'  # Gray for other hubs
+            
+            rows.append([
+                hub['lat'], hub['lon'], radius, color,
+                hub['iata'], hub['name'], hub['city'], hub['country'],
+                round(hub['degree'], 4), round(hub['betweenness'], 4)
+            ])
         
-        for hub in hub_coords:
-            try:
-                # Calculate radius based on centrality
-                centrality = hub['degree'] if size_metric == "degree_centrality" else hub['betweenness']
-                radius = max(5, min(30, 5 + (centrality - min_val) / range_val * 25)) if range_val > 0 else 15
-                
-                # Determine color based on selection
-                if hub['iata'] == selected_from:
-                    color = fill_color = '#34a853'  # Green for source
-                elif hub['iata'] == selected_to:
-                    color = fill_color = '#ea4335'  # Red for destination
-                elif route_path and hub['iata'] in route_path:
-                    color = fill_color = '#1a73e8'  # Blue for route stops
-                else:
-                    color = fill_color = '#5f6368'  # Gray for other hubs
-                
-                # Create popup text
-                popup_text = f"""
-                <div style="min-width: 200px;">
-                    <b>{hub['iata']}</b><br>
-                    {hub['name']}<br>
-                    {hub['city']}, {hub['country']}<br>
-                    <hr>
-                    <b>Centrality:</b><br>
-                    Degree: {hub['degree']:.4f}<br>
-                    Betweenness: {hub['betweenness']:.4f}<br>
-                    <hr>
-                    <small>Click to select as From/To</small>
-                </div>
-                """
-                
-                # Add circle marker
-                folium.CircleMarker(
-                    location=[hub['lat'], hub['lon']],
-                    radius=radius,
-                    popup=folium.Popup(popup_text, max_width=250),
-                    tooltip=f"{hub['iata']} - {hub['name']}",
-                    color=color,
-                    fill=True,
-                    fillColor=fill_color,
-                    fillOpacity=0.7,
-                    weight=3
-                ).add_to(cluster)
-            except Exception:
-                # Skip invalid hub markers
-                continue
+        # Cluster markers to improve map performance with many hubs
+        FastMarkerCluster(rows, callback=_HUB_MARKER_CALLBACK).add_to(map_obj)
     except Exception:
         # If marker creation fails, silently continue
         pass
@@ -467,54 +591,50 @@ def _get_hub_coordinates(hubs_data: List[Dict[str, Any]], analyzer: FlightGraphA
     # Create lookup dict for O(1) access
     coords_dict = {iata: (lat, lon) for lat, lon, iata in all_coords}
     
-    hub_coords = []
-    for hub in hubs_data:
-        try:
-            iata = hub.get('airport')
-            if iata and iata in coords_dict:
-                lat, lon = coords_dict[iata]
-                # Validate coordinates
-                if isinstance(lat, (int, float)) and isinstance(lon, (int, float)):
-                    if -90 <= lat <= 90 and -180 <= lon <= 180:
-                        hub_coords.append({
-                            'lat': float(lat),
-                            'lon': float(lon),
-                            'iata': iata,
-                            'name': hub.get('name', ''),
-                            'city': hub.get('city', ''),
-                            'country': hub.get('country', ''),
-                            'degree': float(hub.get('degree_centrality', 0)),
-                            'betweenness': float(hub.get('betweenness_centrality', 0))
-                        })
-        except Exception:
-            # Skip invalid hubs
-            continue
-    return hub_coords
+    located_hubs = [hub for hub in hubs_data if hub.get('airport') in coords_dict]
+    if not located_hubs:
+        return []
+    
+    # Validate all coordinates at once (NaN fails every comparison)
+    coords = np.array([coords_dict[hub['airport']] for hub in located_hubs], dtype=float)
+    lats, lons = coords[:, 0], coords[:, 1]
+    valid = (lats >= -90) & (lats <= 90) & (lons >= -180) & (lons <= 180)
+    
+    return [
+        {
+            'lat': float(lats[i]),
+            'lon': float(lons[i]),
+            'iata': located_hubs[i]['airport'],
+            'name': located_hubs[i].get('name', ''),
+            'city': located_hubs[i].get('city', ''),
+            'country': located_hubs[i].get('country', ''),
+            'degree': float(located_hubs[i].get('degree_centrality', 0)),
+            'betweenness': float(located_hubs[i].get('betweenness_centrality', 0))
+        }
+        for i in np.flatnonzero(valid)
+    ]
 
 
 def _calculate_map_center(hub_coords: List[Dict[str, Any]], route_coords: List[Tuple[float, float]] = None) -> Tuple[float, float, int]:
     """Calculate map center and zoom level"""
     try:
         if route_coords and len(route_coords) > 0:
-            valid_route_coords = [(lat, lon) for lat, lon in route_coords 
-                                 if isinstance(lat, (int, float)) and isinstance(lon, (int, float))
-                                 and -90 <= lat <= 90 and -180 <= lon <= 180]
-            if valid_route_coords:
-                center_lat = sum(coord[0] for coord in valid_route_coords) / len(valid_route_coords)
-                center_lon = sum(coord[1] for coord in valid_route_coords) / len(valid_route_coords)
+            valid_route_coords = _valid_route_coords(route_coords)
+            if len(valid_route_coords):
+                center_lat, center_lon = valid_route_coords.mean(axis=0)
                 zoom_start = 4
             else:
                 raise ValueError("No valid route coordinates")
         else:
-            center_lat = sum(h['lat'] for h in hub_coords) / len(hub_coords)
-            center_lon = sum(h['lon'] for h in hub_coords) / len(hub_coords)
+            center_lat = np.fromiter((h['lat'] for h in hub_coords), dtype=float, count=len(hub_coords)).mean()
+            center_lon = np.fromiter((h['lon'] for h in hub_coords), dtype=float, count=len(hub_coords)).mean()
             zoom_start = 2
         
         # Validate center coordinates
         if not (-90 <= center_lat <= 90 and -180 <= center_lon <= 180):
             return 20.0, 0.0, 2
         
-        return center_lat, center_lon, zoom_start
+        return float(center_lat), float(center_lon), zoom_start
     except Exception:
         # Fallback to default center
         return 20.0, 0.0, 2
@@ -581,7 +701,7 @@ def display_route_result(result: Dict[str, Any], analyzer: FlightGraphAnalyzer):
         route_coords = [(lat, lon) for lat, lon, _ in path_coordinates]
         m = create_route_map(path_coordinates, route_coords)
         if m:
-            st_folium(m, width=950, height=520, key="route_map_main")
+            st_folium(m, width=950, height=520, key="route_map_main", returned_objects=[])
 
 
 def display_alternative_paths(result: Dict[str, Any], analyzer: FlightGraphAnalyzer):
@@ -654,7 +774,7 @@ def display_alternative_paths(result: Dict[str, Any], analyzer: FlightGraphAnaly
                 route_coords = [(lat, lon) for lat, lon, _ in path_coordinates]
                 m = create_route_map(path_coordinates, route_coords)
                 if m:
-                    st_folium(m, width=900, height=450, key=f"alt_map_{i}")
+                    st_folium(m, width=900, height=450, key=f"alt_map_{i}", returned_objects=[])
 
 
 def display_alternative_hubs(result: Dict[str, Any], analyzer: FlightGraphAnalyzer):
@@ -692,10 +812,8 @@ def _render_sidebar(analyzer: FlightGraphAnalyzer, all_hubs: List[Dict[str, Any]
     st.markdown("### 🔍 Search & Filter")
     
     # Airport selection
-    airports_df = analyzer.airports_df
-    airport_df = airports_df[airports_df['iata'].notna()].copy().sort_values(by='iata')
-    airport_options = airport_df['iata'].tolist()
-    airport_labels = get_airport_display_map(airports_df)
+    airport_options = load_airport_options(_analyzer=analyzer)
+    airport_labels = load_airport_labels(_analyzer=analyzer)
     
     from_airport = st.selectbox(
         "From",
@@ -731,7 +849,7 @@ def _render_sidebar(analyzer: FlightGraphAnalyzer, all_hubs: List[Dict[str, Any]
     }
 
 
-def _render_map_controls(all_hubs: List[Dict[str, Any]]) -> Dict[str, Any]:
+def _render_map_controls(analyzer: FlightGraphAnalyzer) -> Dict[str, Any]:
     """Render map controls (separate from Search & Filter)"""
     st.markdown("### 🗺️ Map Controls")
     
@@ -743,8 +861,7 @@ def _render_map_controls(all_hubs: List[Dict[str, Any]]) -> Dict[str, Any]:
     )
     
     # Country filter
-    countries = sorted(set(h.get('country', '') for h in all_hubs if h.get('country')))
-    country_options = ["All Countries"] + countries
+    country_options = load_country_options(_analyzer=analyzer)
     selected_country = st.selectbox("Filter by Country", country_options)
 
     apply_map = st.button("Apply map filters", type="secondary")
@@ -767,8 +884,6 @@ def _search_route(analyzer: FlightGraphAnalyzer, search_params: Dict[str, Any])
     st.session_state.pop('map_applied', None)
     st.session_state.pop('applied_size_metric', None)
     st.session_state.pop('applied_country', None)
-    # Invalidate filtered hubs cache by changing cache key
-    st.session_state['filtered_hubs_cache_key'] = st.session_state.get('filtered_hubs_cache_key', 0) + 1
     
     with st.spinner("Finding route..."):
         # Main route
@@ -806,13 +921,14 @@ def _search_route(analyzer: FlightGraphAnalyzer, search_params: Dict[str, Any])
         
         st.session_state['route_result'] = main_result
         st.session_state['alt_paths'] = alt_paths
-        st.session_state.pop('alt_hubs', None)
+        st.session_state.pop('alt_routes_page', None)
 
 
 def main():
     """Main Streamlit application - Interactive Map Centered"""
     
-    st.markdown('<h1 class="main-header">Flight Route Advisor</h1>', unsafe_allow_html=True)
+    # Styles and header go out as one element instead of two per rerun
+    st.markdown(_PAGE_STYLE + '<h1 class="main-header">Flight Route Advisor</h1>', unsafe_allow_html=True)
     
     # Load data
     with st.spinner("Loading flight network..."):
@@ -838,14 +954,11 @@ def main():
             _search_route(analyzer, sidebar_result)
     
         # Map controls (separate from search but still in sidebar)
-        map_ctrl = _render_map_controls(all_hubs)
+        map_ctrl = _render_map_controls(analyzer)
         if map_ctrl.get('apply_map'):
             # Clear route search cache to boost performance when applying map filters
             st.session_state.pop('route_result', None)
             st.session_state.pop('alt_paths', None)
-            st.session_state.pop('alt_hubs', None)
-            # Reset cache key for filtered hubs to use fresh cache
-            st.session_state['filtered_hubs_cache_key'] = 0
             
             st.session_state['applied_size_metric'] = map_ctrl.get('size_metric', st.session_state.get('applied_size_metric', 'degree_centrality'))
             st.session_state['applied_country'] = map_ctrl.get('selected_country', st.session_state.get('applied_country', 'All Countries'))
@@ -872,15 +985,11 @@ def main():
     applied_country = st.session_state['applied_country']
     map_applied = st.session_state.get('map_applied', False)
 
-    # Detect if we just ran a search in this rerun
-    is_search_rerun = st.session_state.get('route_result') is not None and sidebar_result and sidebar_result.get('search_clicked')
-
     # Filter hubs using applied settings (cached) only when applied at least once
     if map_applied:
-        cache_key = st.session_state.get('filtered_hubs_cache_key', 0)
-        filtered_hubs = get_filtered_hubs(all_hubs, applied_country, size_metric, _cache_key=cache_key)
+        filtered_hubs = get_filtered_hubs(all_hubs, applied_country, size_metric)
         st.info(f"Showing {len(filtered_hubs)} hubs on map (Country: {applied_country}, Size metric: {size_metric})")
-        _render_main_map(analyzer, filtered_hubs, size_metric, from_airport, to_airport)
+        _render_main_map(analyzer, filtered_hubs, applied_country, size_metric, from_airport, to_airport)
     else:
         filtered_hubs = []
         st.info("Apply map filters to load hubs map.")
@@ -894,16 +1003,25 @@ def main():
     # Network Statistics (collapsed; show only Airports, Routes, Density)
     stats_expander = st.expander("📊 Network Statistics", expanded=False)
     with stats_expander:
-        stats = analyzer.get_network_stats()
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Airports", f"{stats['total_nodes']:,}")
-        with col2:
-            st.metric("Routes", f"{stats['total_edges']:,}")
-        with col3:
-            st.metric("Density", f"{stats['density']:.4f}")
+        stats = load_network_stats(_analyzer=analyzer)
+        metrics = {
+            "Airports": f"{stats['total_nodes']:,}",
+            "Routes": f"{stats['total_edges']:,}",
+            "Density": f"{stats['density']:.4f}",
+        }
+        # One HTML card instead of columns + a separate st.metric per value
+        st.markdown(_render_metric_card(metrics), unsafe_allow_html=True)
     
 
+def _render_metric_card(metrics: Dict[str, str]) -> str:
+    """Build a single HTML card showing label/value metric pairs"""
+    chips = "".join(
+        f'<div class="metric-chip"><small>{label}</small><span>{value}</span></div>'
+        for label, value in metrics.items()
+    )
+    return f'<div class="hero-metrics">{chips}</div>'
+
+
 def _render_route_details(analyzer: FlightGraphAnalyzer) -> None:
     """Render route details and alternative routes"""
     if 'route_result' not in st.session_state:
@@ -936,6 +1054,8 @@ def _render_route_details(analyzer: FlightGraphAnalyzer) -> None:
             leg_times = result.get('leg_times', [])
             transit_times = result.get('transit_times', [])
             
+            # Collect every leg/transit line and emit them in a single markdown call
+            lines = []
             for i, leg in enumerate(result['legs'], 1):
                 leg_info = f"**Leg {i}:** {leg['from']} → {leg['to']} ({leg['distance_km']:,.0f} km"
                 if i <= len(leg_times):
@@ -943,12 +1063,13 @@ def _render_route_details(analyzer: FlightGraphAnalyzer) -> None:
                     leg_mins = int((leg_times[i-1] - leg_hours) * 60)
                     leg_info += f", {leg_hours}h {leg_mins}m"
                 leg_info += ")"
-                st.markdown(leg_info)
+                lines.append(leg_info)
                 
                 if i < len(result['legs']) and i <= len(transit_times):
                     transit_hours = int(transit_times[i-1])
                     transit_mins = int((transit_times[i-1] - transit_hours) * 60)
-                    st.markdown(f"  ⏱️ Transit at {leg['to']}: {transit_hours}h {transit_mins}m")
+                    lines.append(f"⏱️ Transit at {leg['to']}: {transit_hours}h {transit_mins}m")
+            st.markdown("\n\n".join(lines))
     else:
         # Show message when no main route found
         st.warning(result.get("error", "No route found with current constraints."))
@@ -959,7 +1080,16 @@ def _render_route_details(analyzer: FlightGraphAnalyzer) -> None:
         if "error" not in alt_paths and alt_paths.get('paths'):
             st.markdown("---")
             st.markdown("### 🔄 Alternative Routes")
-            for i, path_info in enumerate(alt_paths['paths'], 1):
+            
+            # Page the options so each rerun only ships a few embedded maps
+            paths = alt_paths['paths']
+            page_size = 3
+            page_count = (len(paths) + page_size - 1) // page_size
+            page = 1
+            if page_count > 1:
+                page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1, key="alt_routes_page")
+            first = (page - 1) * page_size
+            for i, path_info in enumerate(paths[first:first + page_size], first + 1):
                 title = f"Option {i}: {' → '.join(path_info['path'])} ({path_info['stops']} stops, {path_info['distance_km']:,.0f} km"
                 if path_info.get('total_route_time_hours'):
                     total_hours = int(path_info['total_route_time_hours'])
@@ -970,21 +1100,11 @@ def _render_route_details(analyzer: FlightGraphAnalyzer) -> None:
 
                 # Show map for each alternative route (no hubs to avoid clutter)
                 try:
-                    alt_path = path_info.get('path', [])
-                    path_coordinates = analyzer.get_airport_coordinates(alt_path)
-                    if path_coordinates:
-                        alt_route_coords = [(lat, lon) for lat, lon, _ in path_coordinates]
-                        alt_map = create_interactive_map(
-                            hubs_data=[],
-                            analyzer=analyzer,
-                            size_metric="degree_centrality",
-                            selected_from=alt_path[0] if alt_path else None,
-                            selected_to=alt_path[-1] if alt_path else None,
-                            route_path=alt_path,
-                            route_coords=alt_route_coords
-                        )
-                        if alt_map:
-                            st_folium(alt_map, width=1000, height=550, key=f"alt_route_map_{i}")
+                    alt_map_html = load_route_map_html(
+                        _analyzer=analyzer, route_path=tuple(path_info.get('path', []))
+                    )
+                    if alt_map_html:
+                        _embed_map_html(alt_map_html, height=550)
                 except Exception:
                     pass
         elif alt_paths.get("error"):
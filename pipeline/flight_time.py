@@ -9,9 +9,11 @@ Supports both single-leg routes and multi-leg routes with transit.
 from __future__ import annotations
 
 import argparse
+import os
 import random
 from pathlib import Path
 from typing import List, Dict, Any, Optional
+import numpy as np
 import pandas as pd
 
 # Average speed for commercial passenger aircraft (km/h)
@@ -72,11 +74,8 @@ def compute_total_route_time(
     
     # Calculate flight time for each leg
     for leg in legs:
-        distance = leg.get('distance_km', 0)
-        if distance is None or pd.isna(distance) or distance <= 0:
-            continue
-        
-        leg_time = compute_flight_time(distance)
+        # compute_flight_time returns None for missing or non-positive distances
+        leg_time = compute_flight_time(leg.get('distance_km', 0))
         if leg_time is None:
             continue
         
@@ -91,18 +90,15 @@ def compute_total_route_time(
     number_of_transits = len(legs) - 1
     
     # Generate transit times (random 2-5h for each transit)
-    transit_times = []
-    total_transit_time = 0.0
-    
-    if number_of_transits > 0:
-        for _ in range(number_of_transits):
-            if use_random_transit:
-                transit_time = random.uniform(TRANSIT_TIME_MIN_HOURS, TRANSIT_TIME_MAX_HOURS)
-            else:
-                # Use average if not random
-                transit_time = (TRANSIT_TIME_MIN_HOURS + TRANSIT_TIME_MAX_HOURS) / 2.0
-            transit_times.append(transit_time)
-            total_transit_time += transit_time
+    if use_random_transit:
+        transit_times = [
+            random.uniform(TRANSIT_TIME_MIN_HOURS, TRANSIT_TIME_MAX_HOURS)
+            for _ in range(number_of_transits)
+        ]
+    else:
+        # Use average if not random
+        transit_times = [(TRANSIT_TIME_MIN_HOURS + TRANSIT_TIME_MAX_HOURS) / 2.0] * number_of_transits
+    total_transit_time = float(sum(transit_times))
     
     total_route_time = total_flight_time + total_transit_time
     
@@ -118,20 +114,38 @@ def compute_total_route_time(
 
 def add_flight_time_columns(df: pd.DataFrame) -> pd.DataFrame:
     """Add flight_time_hours and flight_time_minutes columns to a routes DataFrame."""
-    df = df.copy()
-    df["flight_time_hours"] = df["distance_km"].apply(compute_flight_time)
-    df["flight_time_minutes"] = df["flight_time_hours"] * 60
-    return df
+    # Same rule as compute_flight_time, applied to the whole column at once
+    distances = pd.to_numeric(df["distance_km"], errors="coerce").to_numpy(dtype=float)
+    hours = np.where(distances > 0, distances / AVERAGE_AIRCRAFT_SPEED_KMH, np.nan)
+    # assign returns a new frame without touching the caller's
+    return df.assign(flight_time_hours=hours, flight_time_minutes=hours * 60)
 
 
-def main(input_path: Path, output_path: Path) -> None:
-    routes = pd.read_csv(input_path)
-    if "distance_km" not in routes.columns:
-        raise ValueError("Input file must contain distance_km column.")
-    routes_with_time = add_flight_time_columns(routes)
+def main(input_path: Path, output_path: Path, chunksize: int = 200_000) -> None:
+    # Read columns as text so every chunk is written back exactly as read,
+    # whatever dtype pandas would have inferred for that chunk alone
+    chunks = pd.read_csv(input_path, chunksize=chunksize, dtype=str)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    routes_with_time.to_csv(output_path, index=False, encoding="utf-8")
-    print(f"Saved with flight times: {output_path} (rows: {len(routes_with_time)})")
+    # Write next to the output and swap it in at the end, so the input is never
+    # truncated while it is still being read (e.g. --input and --output are the same file)
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    rows = 0
+    try:
+        for i, routes in enumerate(chunks):
+            if i == 0 and "distance_km" not in routes.columns:
+                raise ValueError("Input file must contain distance_km column.")
+            routes_with_time = add_flight_time_columns(routes)
+            routes_with_time.to_csv(
+                tmp_path, index=False, encoding="utf-8",
+                header=(i == 0), mode="w" if i == 0 else "a"
+            )
+            rows += len(routes_with_time)
+        os.replace(tmp_path, output_path)
+    finally:
+        chunks.close()
+        if tmp_path.exists():
+            tmp_path.unlink()
+    print(f"Saved with flight times: {output_path} (rows: {rows})")
 
 
 if __name__ == "__main__":
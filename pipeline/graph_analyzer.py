@@ -5,8 +5,11 @@ Handles NetworkX graph operations, shortest path, and hub analysis
 
 import networkx as nx
 import pandas as pd
+import numpy as np
+from scipy.sparse import csgraph, csr_array
 from typing import Dict, List, Tuple, Optional, Any
 import json
+import copy
 from .flight_time import compute_total_route_time
 
 
@@ -28,7 +31,22 @@ class FlightGraphAnalyzer:
         self._iata_to_id_cache = None
         self._id_to_iata_cache = None
         self._iata_to_coords_cache = None
+        self._id_to_info_cache = None
+        self._node_index = None
+        self._index_node = None
+        self._csr_graph = None
+        self._csr_rows = None
+        self._csr_cols = None
+        self._csr_airlines = None
+        self._airline_categories = None
+        self._node_countries = None
+        self._country_categories = None
         self._top_hubs_cache = None
+        self._network_stats_cache = None
+        self._hub_analysis_cache = {}
+        self._ranked_hubs_cache = {}
+        self._hub_removal_cache = {}
+        self._route_rows_by_endpoint = None
         self._build_graph()
         self._build_caches()
     
@@ -39,55 +57,111 @@ class FlightGraphAnalyzer:
         # Create directed graph (flights have direction)
         self.graph = nx.DiGraph()
         
-        # Add airport nodes
-        for _, airport in self.airports_df.iterrows():
-            self.graph.add_node(
-                airport['airport_id'],
-                iata=airport.get('iata', ''),
-                name=airport.get('name', ''),
-                city=airport.get('city', ''),
-                country=airport.get('country', ''),
-                latitude=float(airport.get('latitude', 0)),
-                longitude=float(airport.get('longitude', 0))
+        # Add airport nodes (zip over whole columns instead of iterrows)
+        airports = self.airports_df
+        self.graph.add_nodes_from(
+            (airport_id, {
+                "iata": iata,
+                "name": name,
+                "city": city,
+                "country": country,
+                "latitude": float(latitude),
+                "longitude": float(longitude)
+            })
+            for airport_id, iata, name, city, country, latitude, longitude in zip(
+                airports['airport_id'].tolist(),
+                airports['iata'].tolist(),
+                airports['name'].tolist(),
+                airports['city'].tolist(),
+                airports['country'].tolist(),
+                airports['latitude'].tolist(),
+                airports['longitude'].tolist()
             )
+        )
         
-        # Add route edges
-        edge_count = 0
-        for _, route in self.routes_df.iterrows():
-            if pd.notna(route.get('distance_km')):
-                self.graph.add_edge(
-                    route['source_airport_id'],
-                    route['destination_airport_id'],
-                    weight=float(route['distance_km']),
-                    distance_km=float(route['distance_km']),
-                    airline=str(route.get('airline', '')).upper(),
-                    airline_id=int(route.get('airline_id', 0)) if pd.notna(route.get('airline_id')) else 0,
-                    stops=int(route.get('stops', 0)) if pd.notna(route.get('stops')) else 0
-                )
-                edge_count += 1
+        # Add route edges (routes without a distance are skipped);
+        # the edge weight is the route distance in km
+        routes = self.routes_df[self.routes_df['distance_km'].notna()]
+        distances = routes['distance_km'].astype(float).tolist()
+        airlines = [str(airline).upper() for airline in routes['airline'].tolist()]
+        airline_ids = routes['airline_id'].fillna(0).astype(int).tolist()
+        stops = routes['stops'].fillna(0).astype(int).tolist()
+        self.graph.add_edges_from(
+            (source_id, dest_id, {
+                "weight": distance,
+                "airline": airline,
+                "airline_id": airline_id,
+                "stops": stop_count
+            })
+            for source_id, dest_id, distance, airline, airline_id, stop_count in zip(
+                routes['source_airport_id'].tolist(),
+                routes['destination_airport_id'].tolist(),
+                distances, airlines, airline_ids, stops
+            )
+        )
+        
+        # Hub, stats and removal results describe the previous graph, so drop them
+        self._top_hubs_cache = None
+        self._network_stats_cache = None
+        self._hub_analysis_cache = {}
+        self._ranked_hubs_cache = {}
+        self._hub_removal_cache = {}
+        self._route_rows_by_endpoint = None
         
         print(f"Graph built: {self.graph.number_of_nodes()} nodes, {self.graph.number_of_edges()} edges")
     
     def _build_caches(self) -> None:
         """Build lookup caches for fast access"""
+        airports = self.airports_df[
+            self.airports_df['iata'].notna() & self.airports_df['airport_id'].notna()
+        ]
+        # Work on whole columns instead of iterating rows
+        iata_codes = airports['iata'].astype(str).str.upper().tolist()
+        airport_ids = airports['airport_id'].astype(int).tolist()
+        latitudes = airports['latitude'].astype(float).tolist()
+        longitudes = airports['longitude'].astype(float).tolist()
+
         # IATA to airport_id mapping
-        self._iata_to_id_cache = {}
-        self._id_to_iata_cache = {}
-        self._iata_to_coords_cache = {}
-        
-        for _, airport in self.airports_df.iterrows():
-            iata = airport.get('iata')
-            airport_id = airport.get('airport_id')
-            if pd.notna(iata) and pd.notna(airport_id):
-                iata_str = str(iata).upper()
-                self._iata_to_id_cache[iata_str] = int(airport_id)
-                self._id_to_iata_cache[int(airport_id)] = iata_str
-                # Cache coordinates
-                lat = float(airport.get('latitude', 0))
-                lon = float(airport.get('longitude', 0))
-                if lat != 0 or lon != 0:  # Only cache valid coordinates
-                    self._iata_to_coords_cache[iata_str] = (lat, lon)
-        
+        self._iata_to_id_cache = dict(zip(iata_codes, airport_ids))
+        self._id_to_iata_cache = dict(zip(airport_ids, iata_codes))
+        # Cache coordinates for every airport so lookups never fall back to the graph
+        self._iata_to_coords_cache = dict(zip(iata_codes, zip(latitudes, longitudes)))
+        # airport_id -> info dict (first row wins, as with the old boolean-mask lookup)
+        self._id_to_info_cache = (
+            self.airports_df.drop_duplicates(subset='airport_id', keep='first')
+            .set_index('airport_id')[['iata', 'name', 'city', 'country', 'latitude', 'longitude']]
+            .to_dict('index')
+        )
+
+        # Node <-> row index and CSR weight matrix for SciPy shortest paths
+        self._index_node = list(self.graph.nodes())
+        self._node_index = {node: i for i, node in enumerate(self._index_node)}
+        self._csr_graph = nx.to_scipy_sparse_array(
+            self.graph, nodelist=self._index_node, weight='weight', format='csr'
+        )
+        # 32-bit indices are what csgraph works with internally, so it no longer
+        # converts them on every call (weights stay float64 for the same reason)
+        self._csr_graph.indices = self._csr_graph.indices.astype(np.int32)
+        self._csr_graph.indptr = self._csr_graph.indptr.astype(np.int32)
+        # Per-entry endpoints/airline and per-node country, so preference
+        # filters can mask the CSR matrix instead of walking the graph.
+        # Airlines and countries are stored as small category codes.
+        coo = self._csr_graph.tocoo()
+        self._csr_rows, self._csr_cols = coo.row.astype(np.int32), coo.col.astype(np.int32)
+        # (edge airlines were uppercased when the graph was built)
+        adj, index_node = self.graph.adj, self._index_node
+        airlines = pd.Categorical([
+            adj[index_node[u]][index_node[v]]["airline"]
+            for u, v in zip(self._csr_rows.tolist(), self._csr_cols.tolist())
+        ])
+        self._csr_airlines = airlines.codes.astype(np.int16)
+        self._airline_categories = airlines.categories
+        countries = pd.Categorical([
+            str(self.graph.nodes[node].get("country", "")).lower() for node in self._index_node
+        ])
+        self._node_countries = countries.codes.astype(np.int16)
+        self._country_categories = countries.categories
+
         print(f"Caches built: {len(self._iata_to_id_cache)} airports cached")
     
     def find_shortest_path(self, source_iata: str, dest_iata: str) -> Dict[str, Any]:
@@ -101,16 +175,7 @@ class FlightGraphAnalyzer:
         Returns:
             Dictionary with path information
         """
-        # Find airport IDs from IATA codes
-        source_id = self._get_airport_id_by_iata(source_iata)
-        dest_id = self._get_airport_id_by_iata(dest_iata)
-        
-        if not source_id or not dest_id:
-            return {"error": "Airport not found"}
-        
-        if source_id == dest_id:
-            return {"error": "Source and destination are the same"}
-        
+        # find_optimized_route resolves the codes and validates them
         return self.find_optimized_route(
             source_iata,
             dest_iata,
@@ -146,23 +211,28 @@ class FlightGraphAnalyzer:
         if source_id == dest_id:
             return {"error": "Source and destination are the same"}
 
-        working_graph = self.graph.copy()
-        self._apply_preferences(working_graph, source_id, dest_id, preferences)
-
         try:
+            # Searches run on the CSR matrix, masked by the constraints; only the
+            # k-shortest enumeration for larger stop limits walks a filtered graph view
+            csr = self._filtered_csr(source_id, dest_id, preferences) if preferences else None
+            working_graph = self.graph
+            if preferences and objective != "transfers" and max_stops is not None and max_stops > 2:
+                working_graph = self._apply_preferences(source_id, dest_id, preferences)
+
             # Choose algorithm based on objective
             if objective == "transfers":
-                path_nodes = nx.shortest_path(working_graph, source_id, dest_id)
+                # Fewest flights: SciPy BFS
+                path_nodes = self._csr_fewest_hops_path(source_id, dest_id, csr)
                 total_distance = self._calculate_path_distance(path_nodes)
             else:
                 # Fast path when max_stops is small (common case: 0-2)
                 if max_stops is not None and max_stops <= 2:
                     path_nodes = self._fast_constrained_path(
-                        working_graph, source_id, dest_id, max_stops=max_stops
+                        source_id, dest_id, max_stops=max_stops, csr=csr
                     )
                     if path_nodes is None:
                         return {"error": f"No path found within {max_stops} stops"}
-                    total_distance = self._calculate_path_weight(working_graph, path_nodes)
+                    total_distance = self._calculate_path_distance(path_nodes)
                 elif max_stops is not None:
                     # Fallback to simple paths enumeration with limit
                     path_nodes = self._find_path_with_stop_limit(
@@ -170,20 +240,10 @@ class FlightGraphAnalyzer:
                     )
                     if path_nodes is None:
                         return {"error": f"No path found within {max_stops} stops"}
-                    total_distance = self._calculate_path_weight(working_graph, path_nodes)
+                    total_distance = self._calculate_path_distance(path_nodes)
                 else:
-                    path_nodes = nx.shortest_path(
-                        working_graph,
-                        source_id,
-                        dest_id,
-                        weight='weight'
-                    )
-                    total_distance = nx.shortest_path_length(
-                        working_graph,
-                        source_id,
-                        dest_id,
-                        weight='weight'
-                    )
+                    # Run SciPy's C Dijkstra
+                    total_distance, path_nodes = self._csr_shortest_path(source_id, dest_id, csr)
 
             path_iata = [self._get_iata_by_airport_id(node) for node in path_nodes]
             legs = []
@@ -193,7 +253,7 @@ class FlightGraphAnalyzer:
                 legs.append({
                     "from": path_iata[i],
                     "to": path_iata[i+1],
-                    "distance_km": edge_data.get('distance_km', 0),
+                    "distance_km": edge_data.get('weight', 0),
                     "airline": edge_data.get('airline', ''),
                     "stops": edge_data.get('stops', 0)
                 })
@@ -231,73 +291,133 @@ class FlightGraphAnalyzer:
         except Exception as e:
             return {"error": f"Error finding route: {str(e)}"}
 
-    def _calculate_path_weight(self, graph: nx.DiGraph, path_nodes: List[int]) -> float:
-        """Sum weights along a path safely."""
-        total = 0.0
-        for i in range(len(path_nodes) - 1):
-            edge_data = graph[path_nodes[i]][path_nodes[i + 1]]
-            total += float(edge_data.get("weight", edge_data.get("distance_km", 0)))
-        return total
+    def _csr_shortest_path(
+        self, source_id: int, dest_id: int, csr: Optional[csr_array] = None
+    ) -> Tuple[float, List[int]]:
+        """
+        Weighted shortest path using the CSR matrix
+        
+        Args:
+            csr: Filtered matrix from _filtered_csr (defaults to the full network)
+            
+        Returns:
+            (distance, path of airport IDs); raises nx.NetworkXNoPath if unreachable
+        """
+        source_idx = self._node_index[source_id]
+        dest_idx = self._node_index[dest_id]
+        distances, predecessors = csgraph.dijkstra(
+            self._csr_graph if csr is None else csr, indices=source_idx, return_predecessors=True
+        )
+        if distances[dest_idx] == float("inf"):
+            raise nx.NetworkXNoPath(f"No path between {source_id} and {dest_id}")
+        return float(distances[dest_idx]), self._predecessor_path(predecessors, source_idx, dest_idx)
+
+    def _csr_fewest_hops_path(
+        self, source_id: int, dest_id: int, csr: Optional[csr_array] = None
+    ) -> List[int]:
+        """
+        Path with the fewest flights using breadth-first search on the CSR matrix
+        
+        Args:
+            csr: Filtered matrix from _filtered_csr (defaults to the full network)
+            
+        Returns:
+            Path of airport IDs; raises nx.NetworkXNoPath if unreachable
+        """
+        source_idx = self._node_index[source_id]
+        dest_idx = self._node_index[dest_id]
+        _, predecessors = csgraph.breadth_first_order(
+            self._csr_graph if csr is None else csr, source_idx, return_predecessors=True
+        )
+        if predecessors[dest_idx] < 0:
+            raise nx.NetworkXNoPath(f"No path between {source_id} and {dest_id}")
+        return self._predecessor_path(predecessors, source_idx, dest_idx)
+
+    def _predecessor_path(self, predecessors: np.ndarray, source_idx: int, dest_idx: int) -> List[int]:
+        """Walk a SciPy predecessor row back from the destination; returns airport IDs"""
+        path_idx = [dest_idx]
+        while path_idx[-1] != source_idx:
+            path_idx.append(int(predecessors[path_idx[-1]]))
+        return [self._index_node[i] for i in reversed(path_idx)]
+
+    def _filtered_csr(
+        self, source_id: int, dest_id: int, preferences: Dict[str, Any]
+    ) -> csr_array:
+        """CSR matrix without the airports and routes the constraints exclude."""
+        node_ok, route_ok = self._preference_masks(source_id, dest_id, preferences)
+        keep = np.ones(len(self._csr_rows), dtype=bool)
+        if node_ok is not None:
+            keep &= node_ok[self._csr_rows] & node_ok[self._csr_cols]
+        if route_ok is not None:
+            keep &= route_ok
+
+        return csr_array(
+            (self._csr_graph.data[keep], (self._csr_rows[keep], self._csr_cols[keep])),
+            shape=self._csr_graph.shape
+        )
 
     def _fast_constrained_path(
         self,
-        graph: nx.DiGraph,
         source_id: int,
         dest_id: int,
         max_stops: int,
+        csr: Optional[csr_array] = None,
     ) -> Optional[List[int]]:
         """
         Fast path finder for small stop limits (0-2) using direct enumeration,
-        avoiding expensive k-shortest simple paths.
+        avoiding expensive k-shortest simple paths. All one- and two-stop
+        candidates are scored at once with NumPy over the CSR arrays.
+        
+        Args:
+            csr: Filtered matrix from _filtered_csr (defaults to the full network)
         """
-        # 0 stops: direct edge
+        csr = self._csr_graph if csr is None else csr
+        indptr, indices, data = csr.indptr, csr.indices, csr.data
+        s = self._node_index[source_id]
+        t = self._node_index[dest_id]
+        
+        # 0 stops: a direct edge always wins
+        first_nodes = indices[indptr[s]:indptr[s + 1]]
+        first_weights = data[indptr[s]:indptr[s + 1]]
+        if (first_nodes == t).any():
+            return [source_id, dest_id]
         if max_stops == 0:
-            if graph.has_edge(source_id, dest_id):
-                return [source_id, dest_id]
             return None
-
-        # Pre-fetch neighbors for speed
-        neigh = graph.adj
-
+        
+        # Weight of the final leg into dest from each airport (inf when there is none)
+        to_dest = np.full(csr.shape[0], np.inf)
+        into_dest = np.flatnonzero(indices == t)
+        to_dest[np.searchsorted(indptr, into_dest, side="right") - 1] = data[into_dest]
+        
         # 1 stop: source -> mid -> dest
+        one_stop = first_weights + to_dest[first_nodes]
+        best_one = int(np.argmin(one_stop)) if len(one_stop) else -1
+        best_one_w = one_stop[best_one] if best_one >= 0 else np.inf
+        one_stop_path = (
+            [source_id, self._index_node[first_nodes[best_one]], dest_id]
+            if best_one_w < np.inf else None
+        )
         if max_stops == 1:
-            best = None
-            best_w = float("inf")
-            for mid in neigh[source_id]:
-                if mid == dest_id:
-                    return [source_id, dest_id]
-                if graph.has_edge(mid, dest_id):
-                    w = (
-                        float(graph[source_id][mid].get("weight", 0))
-                        + float(graph[mid][dest_id].get("weight", 0))
-                    )
-                    if w < best_w:
-                        best_w = w
-                        best = [source_id, mid, dest_id]
-            return best
-
-        # 2 stops: source -> m1 -> m2 -> dest
-        best = None
-        best_w = float("inf")
-        for m1 in neigh[source_id]:
-            if m1 == dest_id:
-                return [source_id, dest_id]
-            w1 = float(graph[source_id][m1].get("weight", 0))
-            for m2 in neigh[m1]:
-                if m2 == source_id:
-                    continue
-                w2 = w1 + float(graph[m1][m2].get("weight", 0))
-                if m2 == dest_id:
-                    if w2 < best_w:
-                        best_w = w2
-                        best = [source_id, m1, dest_id]
-                    continue
-                if graph.has_edge(m2, dest_id):
-                    w = w2 + float(graph[m2][dest_id].get("weight", 0))
-                    if w < best_w:
-                        best_w = w
-                        best = [source_id, m1, m2, dest_id]
-        return best
+            return one_stop_path
+        
+        # 2 stops: source -> m1 -> m2 -> dest, gathering every m1 row in one go
+        starts = indptr[first_nodes]
+        counts = indptr[first_nodes + 1] - starts
+        m1_pos = np.repeat(np.arange(len(first_nodes)), counts)
+        entries = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(starts, counts)
+        second_nodes = indices[entries]
+        two_stop = first_weights[m1_pos] + data[entries] + to_dest[second_nodes]
+        two_stop[(second_nodes == s) | (second_nodes == t)] = np.inf
+        
+        best_two = int(np.argmin(two_stop)) if len(two_stop) else -1
+        if best_two < 0 or not two_stop[best_two] < best_one_w:
+            return one_stop_path
+        return [
+            source_id,
+            self._index_node[first_nodes[m1_pos[best_two]]],
+            self._index_node[second_nodes[best_two]],
+            dest_id
+        ]
 
     def _find_path_with_stop_limit(
         self,
@@ -323,14 +443,9 @@ class FlightGraphAnalyzer:
             return None
         return None
 
-    def _apply_preferences(
-        self,
-        graph: nx.DiGraph,
-        source_id: int,
-        dest_id: int,
-        preferences: Dict[str, Any]
-    ) -> None:
-        """Apply airline and country constraints to a working graph."""
+    @staticmethod
+    def _preference_sets(preferences: Dict[str, Any]) -> Tuple[set, set, set]:
+        """Normalized (avoid_countries, allowed_countries, preferred_airlines) sets."""
         avoid_countries = {
             country.lower()
             for country in preferences.get("avoid_countries", [])
@@ -346,36 +461,66 @@ class FlightGraphAnalyzer:
             for airline in preferences.get("preferred_airlines", [])
             if airline
         }
+        return avoid_countries, allowed_countries, preferred_airlines
+
+    def _preference_masks(
+        self, source_id: int, dest_id: int, preferences: Dict[str, Any]
+    ) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """
+        Boolean masks of what the constraints keep, compared as category codes
+        
+        Returns:
+            (per-node mask, per-CSR-entry airline mask); None when that kind of
+            constraint is not set. Source and destination are always kept.
+        """
+        avoid_countries, allowed_countries, preferred_airlines = self._preference_sets(preferences)
 
+        node_ok = None
         if avoid_countries or allowed_countries:
-            nodes_to_remove = []
-            for node, data in graph.nodes(data=True):
-                if node in (source_id, dest_id):
-                    continue
-                country = str(data.get("country", "")).lower()
+            node_ok = np.ones(len(self._index_node), dtype=bool)
+            if allowed_countries:
+                node_ok &= np.isin(self._node_countries, self._country_categories.get_indexer(list(allowed_countries)))
+            if avoid_countries:
+                node_ok &= ~np.isin(self._node_countries, self._country_categories.get_indexer(list(avoid_countries)))
+            node_ok[[self._node_index[source_id], self._node_index[dest_id]]] = True
 
-                if allowed_countries and country not in allowed_countries:
-                    nodes_to_remove.append(node)
-                elif avoid_countries and country in avoid_countries:
-                    nodes_to_remove.append(node)
+        route_ok = None
+        if preferred_airlines:
+            # Routes without an airline code are always allowed
+            airline_codes = self._airline_categories.get_indexer([""] + list(preferred_airlines))
+            route_ok = np.isin(self._csr_airlines, airline_codes)
 
-            graph.remove_nodes_from(nodes_to_remove)
+        return node_ok, route_ok
 
-        if preferred_airlines:
-            edges_to_remove = []
-            for u, v, data in graph.edges(data=True):
-                airline = str(data.get("airline", "")).upper()
-                if airline and airline not in preferred_airlines:
-                    edges_to_remove.append((u, v))
-            graph.remove_edges_from(edges_to_remove)
+    def _apply_preferences(
+        self,
+        source_id: int,
+        dest_id: int,
+        preferences: Dict[str, Any]
+    ) -> nx.DiGraph:
+        """Return a read-only view of the graph without the airports and routes the constraints exclude."""
+        node_ok, route_ok = self._preference_masks(source_id, dest_id, preferences)
+        index_node = self._index_node
+
+        nodes_to_remove = []
+        if node_ok is not None:
+            nodes_to_remove = [index_node[i] for i in np.flatnonzero(~node_ok).tolist()]
+
+        edges_to_remove = []
+        if route_ok is not None:
+            edges_to_remove = [
+                (index_node[u], index_node[v])
+                for u, v in zip(self._csr_rows[~route_ok].tolist(), self._csr_cols[~route_ok].tolist())
+            ]
+
+        # Hide the excluded airports/routes instead of copying the whole graph
+        return nx.restricted_view(self.graph, nodes_to_remove, edges_to_remove)
 
     def _calculate_path_distance(self, path_nodes: List[int]) -> float:
-        """Calculate distance for an unweighted path."""
-        distance = 0.0
-        for i in range(len(path_nodes) - 1):
-            edge_data = self.graph[path_nodes[i]][path_nodes[i + 1]]
-            distance += edge_data.get('distance_km', 0)
-        return distance
+        """Sum edge weights (route distances) along a path."""
+        # Preference views share edge data with self.graph, so one lookup serves both
+        adj = self.graph.adj
+        return float(sum(adj[u][v]["weight"] for u, v in zip(path_nodes, path_nodes[1:])))
 
     def _build_criteria_summary(
         self,
@@ -407,13 +552,20 @@ class FlightGraphAnalyzer:
 
         return summary
     
-    def analyze_hubs(self, country: str = None, top_n: int = 10) -> Dict[str, Any]:
+    def analyze_hubs(
+        self,
+        country: str = None,
+        top_n: int = 10,
+        betweenness_samples: Optional[int] = 500,
+    ) -> Dict[str, Any]:
         """
         Analyze airport hubs using centrality measures
         
         Args:
             country: Filter by country (optional)
             top_n: Number of top hubs to return
+            betweenness_samples: Pivot nodes used to estimate betweenness
+                (None for the exact, much slower computation)
             
         Returns:
             Dictionary with hub analysis results
@@ -421,10 +573,73 @@ class FlightGraphAnalyzer:
         if not self.graph:
             return {"error": "Graph not built"}
         
-        # Calculate centrality measures
+        # Callers get a copy, so they cannot change the memo
+        return self._copy_hub_analysis(self._hub_analysis(country, top_n, betweenness_samples))
+    
+    def _hub_analysis(
+        self,
+        country: Optional[str] = None,
+        top_n: int = 10,
+        betweenness_samples: Optional[int] = 500,
+    ) -> Dict[str, Any]:
+        """Memoized analyze_hubs result; shared, so internal callers must not modify it"""
+        # Results only depend on the (static) graph, so reuse earlier analyses
+        cache_key = (country or None, top_n, betweenness_samples)
+        if cache_key in self._hub_analysis_cache:
+            return self._hub_analysis_cache[cache_key]
+        
+        # Hubs are ranked once; each country/top_n is just a filter over that ranking
+        ranked_hubs, ranked_countries = self._get_ranked_hubs(betweenness_samples)
+        if country:
+            hubs_data = [ranked_hubs[i] for i in np.flatnonzero(ranked_countries == country.lower())]
+        else:
+            hubs_data = list(ranked_hubs)
+        
+        # Get top hubs and backup hubs
+        top_hubs = hubs_data[:top_n]
+        backup_hubs = hubs_data[top_n:top_n*2] if len(hubs_data) > top_n else []
+        
+        # Cache top hubs for reuse in find_robust_transfer_paths
+        if top_n <= 10 and not country:  # Only cache global top 10
+            self._top_hubs_cache = top_hubs
+        
+        result = {
+            "country": country or "Global",
+            "top_hubs": top_hubs,
+            "backup_hubs": backup_hubs,
+            "total_airports": len(hubs_data),
+            "all_hubs": hubs_data  # Include all hubs for map visualization
+        }
+        self._hub_analysis_cache[cache_key] = result
+        return result
+    
+    @staticmethod
+    def _copy_hub_analysis(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of a memoized hub analysis (fresh lists and hub dicts), so callers cannot change the memo"""
+        return {
+            **result,
+            "top_hubs": [dict(hub) for hub in result["top_hubs"]],
+            "backup_hubs": [dict(hub) for hub in result["backup_hubs"]],
+            "all_hubs": [dict(hub) for hub in result["all_hubs"]]
+        }
+    
+    def _get_ranked_hubs(self, betweenness_samples: Optional[int]) -> Tuple[List[Dict[str, Any]], np.ndarray]:
+        """
+        Compute centralities once per sample size and rank hubs by degree centrality
+        
+        Returns:
+            (hub dicts sorted by degree centrality, aligned array of lowercase countries)
+        """
+        if betweenness_samples in self._ranked_hubs_cache:
+            return self._ranked_hubs_cache[betweenness_samples]
+        
+        # Sampled betweenness: one Dijkstra per pivot instead of per node
+        k = None
+        if betweenness_samples is not None and betweenness_samples < self.graph.number_of_nodes():
+            k = betweenness_samples
         degree_centrality = nx.degree_centrality(self.graph)
-        betweenness_centrality = nx.betweenness_centrality(self.graph, weight='weight')
-        closeness_centrality = nx.closeness_centrality(self.graph, distance='weight')
+        betweenness_centrality = nx.betweenness_centrality(self.graph, k=k, weight='weight', seed=42)
+        closeness_centrality = self._closeness_centrality()
         pagerank = nx.pagerank(self.graph, weight='weight')
         
         # Create hub data
@@ -432,7 +647,7 @@ class FlightGraphAnalyzer:
         for node in self.graph.nodes():
             airport_info = self._get_airport_info(node)
             if airport_info:
-                hub_info = {
+                hubs_data.append({
                     "airport": airport_info['iata'],
                     "name": airport_info['name'],
                     "city": airport_info['city'],
@@ -441,36 +656,55 @@ class FlightGraphAnalyzer:
                     "betweenness_centrality": betweenness_centrality.get(node, 0),
                     "closeness_centrality": closeness_centrality.get(node, 0),
                     "pagerank": pagerank.get(node, 0)
-                }
-                
-                # Filter by country if specified
-                if not country or airport_info['country'].lower() == country.lower():
-                    hubs_data.append(hub_info)
-        
-        # Sort by degree centrality
-        hubs_data.sort(key=lambda x: x['degree_centrality'], reverse=True)
+                })
         
-        # Get top hubs and backup hubs
-        top_hubs = hubs_data[:top_n]
-        backup_hubs = hubs_data[top_n:top_n*2] if len(hubs_data) > top_n else []
+        # Stable sort by degree centrality (descending), same order as list.sort(reverse=True)
+        degrees = np.fromiter((hub['degree_centrality'] for hub in hubs_data), dtype=float, count=len(hubs_data))
+        ranked_hubs = [hubs_data[i] for i in np.argsort(-degrees, kind='stable')]
+        ranked_countries = np.array([str(hub['country']).lower() for hub in ranked_hubs], dtype=object)
         
-        # Cache top hubs for reuse in find_robust_transfer_paths
-        if top_n <= 10 and not country:  # Only cache global top 10
-            self._top_hubs_cache = top_hubs
+        self._ranked_hubs_cache[betweenness_samples] = (ranked_hubs, ranked_countries)
+        return ranked_hubs, ranked_countries
+    
+    def _closeness_centrality(self, block_size: int = 512) -> Dict[int, float]:
+        """
+        Weighted closeness centrality (same definition as nx.closeness_centrality
+        with distance='weight': inward distances, Wasserman-Faust scaling)
+        computed with SciPy's C Dijkstra on the CSR matrix
         
-        return {
-            "country": country or "Global",
-            "top_hubs": top_hubs,
-            "backup_hubs": backup_hubs,
-            "total_airports": len(hubs_data),
-            "all_hubs": hubs_data  # Include all hubs for map visualization
-        }
+        Args:
+            block_size: Airports solved per Dijkstra call (bounds the distance matrix memory)
+            
+        Returns:
+            Dictionary airport_id -> closeness
+        """
+        n = len(self._index_node)
+        closeness = np.zeros(n)
+        if n > 1:
+            # Distances *to* each airport are distances from it on the reversed network
+            reversed_csr = self._csr_graph.T.tocsr()
+            for start in range(0, n, block_size):
+                distances = csgraph.dijkstra(reversed_csr, indices=np.arange(start, min(start + block_size, n)))
+                reachable = np.isfinite(distances)
+                others = reachable.sum(axis=1) - 1
+                total = np.where(reachable, distances, 0.0).sum(axis=1)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    block = np.where(total > 0, others / total * (others / (n - 1)), 0.0)
+                closeness[start:start + len(block)] = block
+        return dict(zip(self._index_node, closeness.tolist()))
     
     def get_network_stats(self) -> Dict[str, Any]:
         """Get basic network statistics"""
         if not self.graph:
             return {"error": "Graph not built"}
         
+        # The graph is static, so the stats are computed once (callers get a copy)
+        if self._network_stats_cache is None:
+            self._network_stats_cache = self._compute_network_stats()
+        return dict(self._network_stats_cache)
+    
+    def _compute_network_stats(self) -> Dict[str, Any]:
+        """Connectivity and size statistics of the full network"""
         return {
             "total_nodes": self.graph.number_of_nodes(),
             "total_edges": self.graph.number_of_edges(),
@@ -494,6 +728,11 @@ class FlightGraphAnalyzer:
         if not self.graph:
             return {"error": "Graph not built"}
         
+        # The graph is static, so each hub only needs to be analyzed once
+        # (callers get a copy, so they cannot change the memo)
+        if hub_iata in self._hub_removal_cache:
+            return copy.deepcopy(self._hub_removal_cache[hub_iata])
+        
         # Find hub airport ID
         hub_id = self._get_airport_id_by_iata(hub_iata)
         if not hub_id:
@@ -505,9 +744,8 @@ class FlightGraphAnalyzer:
         # Get original network stats
         original_stats = self.get_network_stats()
         
-        # Create copy of graph without the hub
-        graph_without_hub = self.graph.copy()
-        graph_without_hub.remove_node(hub_id)
+        # Read-only view that hides the hub (no copy of the graph)
+        graph_without_hub = nx.restricted_view(self.graph, [hub_id], [])
         
         # Get network stats after hub removal
         remaining_stats = {
@@ -530,63 +768,91 @@ class FlightGraphAnalyzer:
         }
         
         # Find affected routes (routes that used this hub)
-        affected_routes = []
         hub_info = self._get_airport_info(hub_id)
-        
-        for _, route in self.routes_df.iterrows():
-            if (route['source_airport_id'] == hub_id or route['destination_airport_id'] == hub_id):
-                source_iata = self._get_iata_by_airport_id(route['source_airport_id'])
-                dest_iata = self._get_iata_by_airport_id(route['destination_airport_id'])
-                affected_routes.append({
-                    "from": source_iata,
-                    "to": dest_iata,
-                    "distance_km": route.get('distance_km', 0)
-                })
-        
+        hub_routes = self._routes_touching(hub_id)
+        affected_routes_count = len(hub_routes)
+
+        # Only the first 10 are returned, so only build dicts for those
+        affected_routes = [
+            {
+                "from": self._get_iata_by_airport_id(route.source_airport_id),
+                "to": self._get_iata_by_airport_id(route.destination_airport_id),
+                "distance_km": route.distance_km
+            }
+            for route in hub_routes.head(10).itertuples(index=False)
+        ]
+
         # Find alternative paths for some key routes
-        alternative_paths = self._find_alternative_paths(hub_id, graph_without_hub)
+        alternative_paths = self._find_alternative_paths(hub_id)
         
-        return {
+        result = {
             "hub_removed": hub_iata,
             "hub_info": hub_info,
             "original_stats": original_stats,
             "remaining_stats": remaining_stats,
             "impact_metrics": impact_metrics,
-            "affected_routes_count": len(affected_routes),
-            "affected_routes": affected_routes[:10],  # Show first 10
+            "affected_routes_count": affected_routes_count,
+            "affected_routes": affected_routes,  # Show first 10
             "alternative_paths": alternative_paths,
             "severity": self._assess_removal_severity(impact_metrics)
         }
+        self._hub_removal_cache[hub_iata] = result
+        return copy.deepcopy(result)
+    
+    def _routes_touching(self, airport_id: int) -> pd.DataFrame:
+        """Routes departing from or arriving at an airport, in routes_df order"""
+        if self._route_rows_by_endpoint is None:
+            # Row positions per endpoint, grouped once instead of masking every route per call
+            self._route_rows_by_endpoint = (
+                self.routes_df.groupby('source_airport_id').indices,
+                self.routes_df.groupby('destination_airport_id').indices
+            )
+        by_source, by_dest = self._route_rows_by_endpoint
+        empty = np.empty(0, dtype=np.intp)
+        rows = np.union1d(by_source.get(airport_id, empty), by_dest.get(airport_id, empty))
+        return self.routes_df.iloc[rows]
     
-    def _find_alternative_paths(self, removed_hub_id: int, graph_without_hub: nx.DiGraph) -> List[Dict[str, Any]]:
-        """Find alternative paths for routes that were affected by hub removal"""
+    def _find_alternative_paths(self, removed_hub_id: int) -> List[Dict[str, Any]]:
+        """Find alternative paths for trips that connected through the removed hub"""
         alternatives = []
         
-        # Get some sample routes that used the removed hub
+        # Airports with flights into / out of the hub, in routes_df order
+        hub_routes = self._routes_touching(removed_hub_id)
+        sources = hub_routes.loc[hub_routes['destination_airport_id'] == removed_hub_id, 'source_airport_id']
+        destinations = hub_routes.loc[hub_routes['source_airport_id'] == removed_hub_id, 'destination_airport_id']
+        
+        # Sample trips src -> hub -> dst (distinct pairs) that now need another route
         sample_routes = []
-        for _, route in self.routes_df.iterrows():
-            if (route['source_airport_id'] == removed_hub_id or 
-                route['destination_airport_id'] == removed_hub_id):
-                if route['source_airport_id'] != removed_hub_id:
-                    sample_routes.append((route['source_airport_id'], removed_hub_id))
-                if route['destination_airport_id'] != removed_hub_id:
-                    sample_routes.append((removed_hub_id, route['destination_airport_id']))
-        
-        # Test alternative paths for a few sample routes
-        for i, (source_id, dest_id) in enumerate(sample_routes[:5]):  # Test first 5
-            try:
-                if source_id in graph_without_hub.nodes() and dest_id in graph_without_hub.nodes():
-                    alt_path = nx.shortest_path(graph_without_hub, source_id, dest_id, weight='weight')
-                    alt_distance = nx.shortest_path_length(graph_without_hub, source_id, dest_id, weight='weight')
-                    
-                    alternatives.append({
-                        "original_from": self._get_iata_by_airport_id(source_id),
-                        "original_to": self._get_iata_by_airport_id(dest_id),
-                        "alternative_path": [self._get_iata_by_airport_id(node) for node in alt_path],
-                        "alternative_distance": alt_distance,
-                        "path_length": len(alt_path) - 1
-                    })
-            except nx.NetworkXNoPath:
+        for source_id in dict.fromkeys(sources.tolist()):
+            for dest_id in dict.fromkeys(destinations.tolist()):
+                if source_id != dest_id and source_id in self._node_index and dest_id in self._node_index:
+                    sample_routes.append((source_id, dest_id))
+                if len(sample_routes) >= 5:
+                    break
+            if len(sample_routes) >= 5:
+                break
+        if not sample_routes:
+            return alternatives
+        
+        # One SciPy Dijkstra call for all sample sources on the network without the hub
+        hub_idx = self._node_index[removed_hub_id]
+        keep = (self._csr_rows != hub_idx) & (self._csr_cols != hub_idx)
+        csr_without_hub = csr_array(
+            (self._csr_graph.data[keep], (self._csr_rows[keep], self._csr_cols[keep])),
+            shape=self._csr_graph.shape
+        )
+        source_rows = {source_id: i for i, source_id in enumerate(dict.fromkeys(s for s, _ in sample_routes))}
+        distances, predecessors = csgraph.dijkstra(
+            csr_without_hub,
+            indices=[self._node_index[source_id] for source_id in source_rows],
+            return_predecessors=True
+        )
+        
+        for source_id, dest_id in sample_routes:
+            row = source_rows[source_id]
+            dest_idx = self._node_index[dest_id]
+            alt_distance = float(distances[row, dest_idx])
+            if alt_distance == float('inf'):
                 alternatives.append({
                     "original_from": self._get_iata_by_airport_id(source_id),
                     "original_to": self._get_iata_by_airport_id(dest_id),
@@ -594,6 +860,15 @@ class FlightGraphAnalyzer:
                     "alternative_distance": float('inf'),
                     "path_length": 0
                 })
+                continue
+            alt_path = self._predecessor_path(predecessors[row], self._node_index[source_id], dest_idx)
+            alternatives.append({
+                "original_from": self._get_iata_by_airport_id(source_id),
+                "original_to": self._get_iata_by_airport_id(dest_id),
+                "alternative_path": [self._get_iata_by_airport_id(node) for node in alt_path],
+                "alternative_distance": alt_distance,
+                "path_length": len(alt_path) - 1
+            })
         
         return alternatives
     
@@ -640,8 +915,7 @@ class FlightGraphAnalyzer:
         if source_id == dest_id:
             return {"error": "Source and destination are the same"}
         
-        working_graph = self.graph.copy()
-        self._apply_preferences(working_graph, source_id, dest_id, preferences)
+        working_graph = self._apply_preferences(source_id, dest_id, preferences)
         
         try:
             # Find k-shortest paths using NetworkX
@@ -653,21 +927,23 @@ class FlightGraphAnalyzer:
             try:
                 if max_stops is not None and max_stops <= 2:
                     first_path = self._fast_constrained_path(
-                        working_graph, source_id, dest_id, max_stops=max_stops
+                        source_id, dest_id, max_stops=max_stops,
+                        csr=self._filtered_csr(source_id, dest_id, preferences) if preferences else None
                     )
                     if first_path is None:
                         return {"error": f"No path found within {max_stops} stops"}
-                    first_distance = self._calculate_path_weight(working_graph, first_path)
+                    first_distance = self._calculate_path_distance(first_path)
                 elif max_stops is not None:
                     first_path = self._find_path_with_stop_limit(
                         working_graph, source_id, dest_id, max_stops=max_stops
                     )
                     if first_path is None:
                         return {"error": f"No path found within {max_stops} stops"}
-                    first_distance = self._calculate_path_weight(working_graph, first_path)
+                    first_distance = self._calculate_path_distance(first_path)
                 else:
-                    first_path = nx.shortest_path(working_graph, source_id, dest_id, weight='weight')
-                    first_distance = nx.shortest_path_length(working_graph, source_id, dest_id, weight='weight')
+                    first_distance, first_path = nx.bidirectional_dijkstra(
+                        working_graph, source_id, dest_id, weight='weight'
+                    )
                 
                 alternative_paths.append({
                     "path": [self._get_iata_by_airport_id(node) for node in first_path],
@@ -680,39 +956,38 @@ class FlightGraphAnalyzer:
                 return {"error": "No path found"}
             
             # Find alternative paths by trying different approaches
-            # Method 1: Remove edges from shortest path and find new paths
-            temp_graph = working_graph.copy()
-            for i in range(len(first_path) - 1):
-                if temp_graph.has_edge(first_path[i], first_path[i+1]):
-                    temp_graph.remove_edge(first_path[i], first_path[i+1])
+            # Method 1: Hide each edge of the shortest path in turn and find new paths
+            # (a read-only view per edge instead of copying the whole graph)
+            for u, v in zip(first_path, first_path[1:]):
+                temp_graph = nx.restricted_view(working_graph, [], [(u, v)])
+                
+                try:
+                    alt_distance, alt_path = nx.bidirectional_dijkstra(
+                        temp_graph, source_id, dest_id, weight='weight'
+                    )
                     
-                    try:
-                        alt_path = nx.shortest_path(temp_graph, source_id, dest_id, weight='weight')
-                        alt_distance = nx.shortest_path_length(temp_graph, source_id, dest_id, weight='weight')
+                    # Check if this is a different path
+                    if alt_path != first_path and alt_path not in [p["path"] for p in alternative_paths]:
+                        alternative_paths.append({
+                            "path": [self._get_iata_by_airport_id(node) for node in alt_path],
+                            "distance_km": alt_distance,
+                            "stops": len(alt_path) - 2,
+                            "transfer_hubs": [self._get_iata_by_airport_id(node) for node in alt_path[1:-1]],
+                            "rank": len(alternative_paths) + 1
+                        })
                         
-                        # Check if this is a different path
-                        if alt_path != first_path and alt_path not in [p["path"] for p in alternative_paths]:
-                            alternative_paths.append({
-                                "path": [self._get_iata_by_airport_id(node) for node in alt_path],
-                                "distance_km": alt_distance,
-                                "stops": len(alt_path) - 2,
-                                "transfer_hubs": [self._get_iata_by_airport_id(node) for node in alt_path[1:-1]],
-                                "rank": len(alternative_paths) + 1
-                            })
-                            
-                            if len(alternative_paths) >= k:
-                                break
-                    except nx.NetworkXNoPath:
-                        continue
-                    
-                    # Restore edge for next iteration
-                    temp_graph.add_edge(first_path[i], first_path[i+1], **working_graph[first_path[i]][first_path[i+1]])
+                        if len(alternative_paths) >= k:
+                            break
+                except nx.NetworkXNoPath:
+                    # Dest is unreachable without this flight; stop looking
+                    # for edge-removal alternatives
+                    break
             
             # Method 2: Find paths through different major hubs
             if len(alternative_paths) < k:
                 # Use cached hubs if available, otherwise compute once
                 if self._top_hubs_cache is None:
-                    top_hubs_result = self.analyze_hubs(top_n=10)
+                    top_hubs_result = self._hub_analysis(top_n=10)
                     self._top_hubs_cache = top_hubs_result.get('top_hubs', [])
                 major_hubs = [self._get_airport_id_by_iata(hub['airport']) for hub in self._top_hubs_cache 
                              if hub['airport'] not in [source_iata, dest_iata]]
@@ -721,13 +996,12 @@ class FlightGraphAnalyzer:
                     if hub_id in working_graph.nodes() and hub_id not in first_path:
                         try:
                             # Path through this hub
-                            path1 = nx.shortest_path(working_graph, source_id, hub_id, weight='weight')
-                            path2 = nx.shortest_path(working_graph, hub_id, dest_id, weight='weight')
+                            dist1, path1 = nx.bidirectional_dijkstra(working_graph, source_id, hub_id, weight='weight')
+                            dist2, path2 = nx.bidirectional_dijkstra(working_graph, hub_id, dest_id, weight='weight')
                             
                             # Combine paths (remove duplicate hub)
                             combined_path = path1 + path2[1:]
-                            combined_distance = nx.shortest_path_length(working_graph, source_id, hub_id, weight='weight') + \
-                                               nx.shortest_path_length(working_graph, hub_id, dest_id, weight='weight')
+                            combined_distance = dist1 + dist2
                             
                             # Check if different from existing paths
                             path_iata = [self._get_iata_by_airport_id(node) for node in combined_path]
@@ -760,7 +1034,7 @@ class FlightGraphAnalyzer:
                 for i in range(len(path_nodes) - 1):
                     if self.graph.has_edge(path_nodes[i], path_nodes[i+1]):
                         edge_data = self.graph[path_nodes[i]][path_nodes[i+1]]
-                        distance = edge_data.get('distance_km', 0)
+                        distance = edge_data.get('weight', 0)
                         if distance and distance > 0:
                             legs.append({
                                 "distance_km": distance
@@ -817,89 +1091,83 @@ class FlightGraphAnalyzer:
             return {"error": "Airport not found"}
         
         # Get hub analysis
-        hubs_result = self.analyze_hubs(top_n=50)
+        hubs_result = self._hub_analysis(top_n=50)
         all_hubs = hubs_result['top_hubs']
         
         # Find hubs that can serve as transfer points
         alternative_hubs = []
         
+        # Two SciPy Dijkstra runs answer every hub: source -> all airports, and
+        # all airports -> dest (on the reversed network)
+        source_idx = self._node_index[source_id]
+        dest_idx = self._node_index[dest_id]
+        from_source, pred_from_source = csgraph.dijkstra(
+            self._csr_graph, indices=source_idx, return_predecessors=True
+        )
+        to_dest, pred_to_dest = csgraph.dijkstra(
+            self._csr_graph.T.tocsr(), indices=dest_idx, return_predecessors=True
+        )
+        direct_dist = float(from_source[dest_idx])
+        
         for hub in all_hubs:
             hub_iata = hub['airport']
             hub_id = self._get_airport_id_by_iata(hub_iata)
             
-            if hub_id and hub_id not in [source_id, dest_id]:
-                # Check if this hub can serve as transfer
-                try:
-                    # Check if path exists: source -> hub -> dest
-                    path1_exists = nx.has_path(self.graph, source_id, hub_id)
-                    path2_exists = nx.has_path(self.graph, hub_id, dest_id)
-                    
-                    if path1_exists and path2_exists:
-                        # Calculate total distance through this hub
-                        dist1 = nx.shortest_path_length(self.graph, source_id, hub_id, weight='weight')
-                        dist2 = nx.shortest_path_length(self.graph, hub_id, dest_id, weight='weight')
-                        total_dist = dist1 + dist2
-                        
-                        # Get direct path distance for comparison
-                        try:
-                            direct_dist = nx.shortest_path_length(self.graph, source_id, dest_id, weight='weight')
-                            efficiency = (direct_dist / total_dist) * 100 if total_dist > 0 else 0
-                        except nx.NetworkXNoPath:
-                            direct_dist = float('inf')
-                            efficiency = 100  # This hub provides connectivity
-                        
-                        # Calculate flight time for route through this hub
-                        legs = []
-                        # Leg 1: source -> hub
-                        try:
-                            path1_nodes = nx.shortest_path(self.graph, source_id, hub_id, weight='weight')
-                            for i in range(len(path1_nodes) - 1):
-                                if self.graph.has_edge(path1_nodes[i], path1_nodes[i+1]):
-                                    edge_data = self.graph[path1_nodes[i]][path1_nodes[i+1]]
-                                    distance = edge_data.get('distance_km', 0)
-                                    if distance and distance > 0:
-                                        legs.append({"distance_km": distance})
-                        except nx.NetworkXNoPath:
-                            pass
-                        
-                        # Leg 2: hub -> dest
-                        try:
-                            path2_nodes = nx.shortest_path(self.graph, hub_id, dest_id, weight='weight')
-                            for i in range(len(path2_nodes) - 1):
-                                if self.graph.has_edge(path2_nodes[i], path2_nodes[i+1]):
-                                    edge_data = self.graph[path2_nodes[i]][path2_nodes[i+1]]
-                                    distance = edge_data.get('distance_km', 0)
-                                    if distance and distance > 0:
-                                        legs.append({"distance_km": distance})
-                        except nx.NetworkXNoPath:
-                            pass
-                        
-                        hub_info = {
-                            "hub": hub_iata,
-                            "name": hub['name'],
-                            "city": hub['city'],
-                            "country": hub['country'],
-                            "degree_centrality": hub['degree_centrality'],
-                            "betweenness_centrality": hub['betweenness_centrality'],
-                            "total_distance_km": total_dist,
-                            "direct_distance_km": direct_dist,
-                            "efficiency_percent": efficiency,
-                            "path": f"{source_iata} -> {hub_iata} -> {dest_iata}"
-                        }
-                        
-                        # Add flight time if legs available
-                        if legs:
-                            time_info = compute_total_route_time(legs, use_random_transit=True)
-                            if time_info:
-                                hub_info.update({
-                                    "total_flight_time_hours": time_info.get('total_flight_time_hours'),
-                                    "total_transit_time_hours": time_info.get('total_transit_time_hours'),
-                                    "total_route_time_hours": time_info.get('total_route_time_hours')
-                                })
-                        
-                        alternative_hubs.append(hub_info)
-                except Exception:
+            if hub_id and hub_id not in [source_id, dest_id] and hub_id in self._node_index:
+                hub_idx = self._node_index[hub_id]
+                dist1 = float(from_source[hub_idx])
+                dist2 = float(to_dest[hub_idx])
+                
+                # Check if path exists: source -> hub -> dest
+                if dist1 == float('inf') or dist2 == float('inf'):
                     continue
+                
+                # Calculate total distance through this hub
+                total_dist = dist1 + dist2
+                
+                # Compare with the direct path distance
+                if direct_dist == float('inf'):
+                    efficiency = 100  # This hub provides connectivity
+                else:
+                    efficiency = (direct_dist / total_dist) * 100 if total_dist > 0 else 0
+                
+                # Legs source -> hub, then hub -> dest (predecessors on the reversed
+                # network point towards dest)
+                path_nodes = self._predecessor_path(pred_from_source, source_idx, hub_idx)
+                next_idx = hub_idx
+                while next_idx != dest_idx:
+                    next_idx = int(pred_to_dest[next_idx])
+                    path_nodes.append(self._index_node[next_idx])
+                legs = []
+                for u, v in zip(path_nodes, path_nodes[1:]):
+                    distance = self.graph[u][v].get('weight', 0)
+                    if distance and distance > 0:
+                        legs.append({"distance_km": distance})
+                
+                hub_info = {
+                    "hub": hub_iata,
+                    "name": hub['name'],
+                    "city": hub['city'],
+                    "country": hub['country'],
+                    "degree_centrality": hub['degree_centrality'],
+                    "betweenness_centrality": hub['betweenness_centrality'],
+                    "total_distance_km": total_dist,
+                    "direct_distance_km": direct_dist,
+                    "efficiency_percent": efficiency,
+                    "path": f"{source_iata} -> {hub_iata} -> {dest_iata}"
+                }
+                
+                # Add flight time if legs available
+                if legs:
+                    time_info = compute_total_route_time(legs, use_random_transit=True)
+                    if time_info:
+                        hub_info.update({
+                            "total_flight_time_hours": time_info.get('total_flight_time_hours'),
+                            "total_transit_time_hours": time_info.get('total_transit_time_hours'),
+                            "total_route_time_hours": time_info.get('total_route_time_hours')
+                        })
+                
+                alternative_hubs.append(hub_info)
         
         # Sort by efficiency and centrality
         alternative_hubs.sort(key=lambda x: (x['efficiency_percent'], x['degree_centrality']), reverse=True)
@@ -921,22 +1189,9 @@ class FlightGraphAnalyzer:
         Returns:
             List of (lat, lon, iata) tuples
         """
-        coordinates = []
-        for iata in iata_codes:
-            iata_upper = str(iata).upper()
-            # Try cache first (fastest)
-            if iata_upper in self._iata_to_coords_cache:
-                lat, lon = self._iata_to_coords_cache[iata_upper]
-                coordinates.append((lat, lon, iata_upper))
-            else:
-                # Fallback to graph lookup
-                airport_id = self._get_airport_id_by_iata(iata)
-                if airport_id and airport_id in self.graph.nodes():
-                    node_data = self.graph.nodes[airport_id]
-                    lat = node_data.get('latitude', 0)
-                    lon = node_data.get('longitude', 0)
-                    coordinates.append((lat, lon, iata_upper))
-        return coordinates
+        coords_cache = self._iata_to_coords_cache
+        codes = (str(iata).upper() for iata in iata_codes)
+        return [(*coords_cache[code], code) for code in codes if code in coords_cache]
     
     def _get_airport_id_by_iata(self, iata: str) -> Optional[int]:
         """Get airport ID by IATA code (optimized with cache)"""
@@ -952,18 +1207,19 @@ class FlightGraphAnalyzer:
         return self._id_to_iata_cache.get(airport_id, str(airport_id))
     
     def _get_airport_info(self, airport_id: int) -> Optional[Dict[str, Any]]:
-        """Get airport information by ID"""
-        airport = self.airports_df[self.airports_df['airport_id'] == airport_id]
-        if not airport.empty:
-            return {
-                'iata': airport.iloc[0]['iata'],
-                'name': airport.iloc[0]['name'],
-                'city': airport.iloc[0]['city'],
-                'country': airport.iloc[0]['country'],
-                'latitude': airport.iloc[0]['latitude'],
-                'longitude': airport.iloc[0]['longitude']
-            }
-        return None
+        """Get airport information by ID (optimized with cache)"""
+        if self._id_to_info_cache is None:
+            self._build_caches()
+        info = self._id_to_info_cache.get(airport_id)
+        return dict(info) if info is not None else None
+
+
+def _read_csv(path) -> pd.DataFrame:
+    """Read a cleaned CSV with pyarrow's multithreaded parser when it is installed"""
+    try:
+        return pd.read_csv(path, engine="pyarrow")
+    except ImportError:
+        return pd.read_csv(path)
 
 
 def load_flight_data(data_dir: str = "data/cleaned") -> Tuple[pd.DataFrame, pd.DataFrame]:
@@ -984,14 +1240,14 @@ def load_flight_data(data_dir: str = "data/cleaned") -> Tuple[pd.DataFrame, pd.D
     # Load airports
     airports_file = data_path / "airports_cleaned.csv"
     if airports_file.exists():
-        airports_df = pd.read_csv(airports_file)
+        airports_df = _read_csv(airports_file)
     else:
         raise FileNotFoundError(f"Airports file not found: {airports_file}")
     
     # Load routes
     routes_file = data_path / "routes_graph.csv"
     if routes_file.exists():
-        routes_df = pd.read_csv(routes_file)
+        routes_df = _read_csv(routes_file)
     else:
         raise FileNotFoundError(f"Routes file not found: {routes_file}")
     